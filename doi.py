@@ -1,11 +1,15 @@
 import time
-import json
 import re
 import io
 import os
+import gzip
+import zlib
 import hashlib
-import json
+import orjson
 import urllib.request
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlparse
 from standardise import levenshtein
@@ -20,15 +24,59 @@ from logger import print_error, print_warn, print_info, print_misc
 # List of websites that block web scrapers
 sites_blocking_scrappers = ["www.sciencedirect.com", "journals.biologists.com"]
 
+# DOI patterns, compiled once rather than on every page parsed
+_DOI_META_RE = re.compile(r'<meta name=\".*\" content=\"(?:doi:)?(10\.\d{4,9}/[-._()/:a-zA-Z0-9]+)\"', re.IGNORECASE)
+_DOI_LINK_RE = re.compile(r'<a[^>]*class="[^"]*doi[^"]*"[^>]*href="https://doi.org/([^"]+)"', re.IGNORECASE)
+_DOI_TEXT_RE = re.compile(r"(?:https://doi.org/[^\/])?(10.\d{4,9}/[-._()/:a-zA-Z0-9]+)", re.IGNORECASE)
+_DOI_URL_RE = re.compile(r'10\.\d{4,9}/[-._;()/:A-Z0-9]+?(?=/|$|\.pdf)', re.IGNORECASE)
+_DOI_URL_EXTENDED_RE = re.compile(r'10\.\d{4,9}/[-._;():A-Z0-9]+/[-._;():A-Z0-9]+', re.IGNORECASE)
+_DOI_URL_FULL_RE = re.compile(r'10\.\d{4,9}/[-._;()/:A-Z0-9]+', re.IGNORECASE)
+# Cheap shape check used to reject malformed DOIs before any API request is made
+_DOI_PREFIX_RE = re.compile(r'10\.\d{4,9}/')
+
 # Dic of domains and times last scraped
 last_scraped = {}
 
+# Dic of URLs and content already loaded from or saved to the cache during this run
+memory_cache = {}
+
+# Set of URLs that could not be fetched by any method during this run
+failed_urls = set()
+
+# Connect and read timeouts in seconds. A dead host fails on connect quickly, so keep that short
+HTTP_CONNECT_TIMEOUT = float(os.getenv("DOI_CONNECT_TIMEOUT", 5))
+HTTP_READ_TIMEOUT = float(os.getenv("DOI_READ_TIMEOUT", 10))
+HTTP_TIMEOUT = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+
+# Keep-alive session for the doi.org and shortdoi.org APIs, which are called once or more per publication.
+# A stalled read is retried once; a failed connect is not retried.
+api_session = requests.Session()
+api_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4,
+                                          max_retries=Retry(total=1, connect=0, read=1, redirect=False)))
+
+def wait_for_domain(domain, delay):
+    """
+    Sleep only as long as needed so requests to the same domain are at least `delay` seconds apart.
+    """
+    elapsed = time.time() - last_scraped.get(domain, 0)
+    if elapsed < delay:
+        print_misc(f"Sleeping for {delay - elapsed:.1f} seconds to avoid being blocked by {domain}")
+        time.sleep(delay - elapsed)
+    last_scraped[domain] = time.time()
+
 def get_saved_html_path(url):
     """
     Generate a file path based on a hash of the URL.
     """
     # Generate a unique filename based on the URL
-    hash_url = hashlib.md5(url.encode()).hexdigest()  # Use MD5 hash for a unique identifier
+    hash_url = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()  # Use BLAKE2b hash for a unique identifier
+    return os.path.join("html_cache", f"{hash_url}.html.gz")
+
+def get_legacy_html_path(url):
+    """
+    Generate the file path used before the cache was compressed, so existing files are still read.
+    """
+    hash_url = hashlib.md5(url.encode()).hexdigest()
     return os.path.join("html_cache", f"{hash_url}.html")
 
 def save_html_to_file(url, html_content):
@@ -42,21 +90,34 @@ def save_html_to_file(url, html_content):
     # Generate the file path
     file_path = get_saved_html_path(url)
     
-    # Save the HTML content to the file
-    with open(file_path, "w", encoding="utf-8") as f:
+    # Save the HTML content to the file, compressed (fast level, pages shrink ~5x).
+    # Write to a temporary file first so a killed run never leaves a truncated gzip behind
+    tmp_path = f"{file_path}.tmp.{os.getpid()}"
+    with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=1) as f:
         f.write(html_content)
+    os.replace(tmp_path, file_path)
+    memory_cache[url] = html_content
 
     print_misc(f"Saved HTML content to file: {file_path}")
 
 def load_html_from_file(url):
     """
-    Load the HTML content from a file if it exists.
+    Load the HTML content from memory, or from a file if it exists.
     """
-    file_path = get_saved_html_path(url)
-    if os.path.exists(file_path):
-        print_misc("Loading HTML from file:", file_path)
-        with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
+    if url in memory_cache:
+        return memory_cache[url]
+    # Open directly rather than checking existence first; a miss is just FileNotFoundError
+    for file_path, opener in ((get_saved_html_path(url), gzip.open), (get_legacy_html_path(url), open)):
+        try:
+            with opener(file_path, "rt", encoding="utf-8") as f:
+                memory_cache[url] = f.read()
+        except FileNotFoundError:
+            continue
+        except (EOFError, gzip.BadGzipFile, zlib.error, UnicodeDecodeError):
+            print_warn(f"Ignoring corrupt cache file: {file_path}")
+            continue
+        print_misc(f"Loading HTML from file: {file_path}")
+        return memory_cache[url]
     return None
 
 def get_url_content(url):
@@ -64,14 +125,20 @@ def get_url_content(url):
     Fetch the HTML content from a URL.
     """
     html = load_html_from_file(url)
-    if html is None and urlparse(url).hostname not in sites_blocking_scrappers:
+    if html is not None:
+        return html # Already cached, no need to write it again
+    if url in failed_urls:
+        return None # Already failed this run, don't sleep and launch a browser again
+
+    if urlparse(url).hostname not in sites_blocking_scrappers:
         html = get_url_content_using_urllib(url)
-    if html is None:
+    if html is None and url not in failed_urls:
         print_misc(f"Trying to fetch content via browser {url}")
         time.sleep(10)
         html = asyncio.run(get_url_content_using_browser(url))
     if html is None:
         print_error(f"Failed to fetch content for {url}")
+        failed_urls.add(url)
         return None
     
     save_html_to_file(url, html) # Cache the HTML content
@@ -86,21 +153,23 @@ def get_doi(url, author):
     slug = url.split('/')[-1]
 
     html = get_url_content(url)
+    if html is None:
+        return None # Page could not be fetched, nothing to parse
 
-    dois_in_metadata = extract_doi_metadata(url)
+    dois_in_metadata = extract_doi_metadata(html)
     if dois_in_metadata and len(dois_in_metadata) == 1: # If there is only one DOI, it is likely to be correct
         return dois_in_metadata[0]
 
     # Parse the page for DOIs
     dois_parsed = parse_dois(html, url, author)
-    dois = dois_in_metadata.extend(dois_parsed)
+    dois = dois_in_metadata + dois_parsed
     if not dois:
         print_warn(f"No DOIs found in metadata or parsed HTML for {url}")
         return None
     if len(dois) == 1: # If there is only one DOI, it is likely to be correct
         return dois[0]
     for doi in dois: # If there are multiple DOIs on the page, check each one
-        print_misc("Multiple DOIs:", slug, doi)
+        print_misc(f"Multiple DOIs: {slug} {doi}")
         # If part of slug in part of doi, then it is likely the correct one
         if slug in doi: # If the DOI contains the URL slug, it is likely the correct one e.g, https://www.nature.com/articles/nclimate2195 which has nclimate2195 (https://doi.org/10.1038/nclimate2195)
             return doi
@@ -117,11 +186,7 @@ def get_doi_from_title(pub_title, author):
     # Google Search the publication's title to find what is likely the publication's url and then the DOI from that page
     print_misc(f"Publication URL is a Google Scholar URL. Publication Title: {pub_title}")
 
-    domain = "google.com"
-    if domain in last_scraped and time.time() - last_scraped[domain] < 30:
-        print_misc(f"Sleeping for 1 seconds to avoid being blocked by {domain}")
-        time.sleep(1)
-    last_scraped[domain] = time.time()
+    wait_for_domain("google.com", 1)
 
     results = search(pub_title)
     doi = None
@@ -159,17 +224,12 @@ def get_content_from_pdf(pdf_bytes, url):
 def get_url_content_using_urllib(url):
     """Fetch the HTML content using urllib.request."""
 
-    domain = urlparse(url).hostname
-    if domain in last_scraped and time.time() - last_scraped[domain] < 30:
-        print_misc(f"Sleeping for 10 seconds to avoid being blocked by {domain}")
-        time.sleep(10)
-
-    last_scraped[domain] = time.time()
+    wait_for_domain(urlparse(url).hostname, 10)
 
     headers = {"User-Agent": "Mozilla/5.0"}
     req = urllib.request.Request(url, headers=headers)
     try:
-        with urllib.request.build_opener(urllib.request.HTTPCookieProcessor()).open(req) as response:
+        with urllib.request.build_opener(urllib.request.HTTPCookieProcessor()).open(req, timeout=HTTP_READ_TIMEOUT) as response:
             content_type = response.headers.get('Content-Type', '')
             content = response.read()
             if 'application/pdf' in content_type or '.pdf' in url:
@@ -188,20 +248,22 @@ def get_url_content_using_urllib(url):
             site = urlparse(url).hostname
             print_warn(f"Adding {site} to sites_blocking_scrappers to prevent future attempts")
             sites_blocking_scrappers.append(site)
+        elif err.code in (404, 410):
+            # The page does not exist, so retrying it in a browser would only waste time
+            failed_urls.add(url)
+        return None
+    except (URLError, TimeoutError) as e:
+        # Connect failures and stalled reads; get_url_content falls back to the browser
+        print_error(f"Error fetching content from {url}: {e}")
         return None
     except UnicodeDecodeError as e:
         print_error(f"Decode error: {e}")
         return None
 
-@lru_cache(maxsize=1000)
 async def get_url_content_using_browser(url):
     """Fetch the HTML content using SeleniumBase with undetected-chromedriver."""
 
-    domain = urlparse(url).hostname
-    if domain in last_scraped and time.time() - last_scraped[domain] < 30:
-        print_misc(f"Sleeping for 10 seconds to avoid being blocked by {domain}")
-        time.sleep(10)
-    last_scraped[domain] = time.time()
+    wait_for_domain(urlparse(url).hostname, 10)
 
     try:
         # SeleniumBase configuration with stealth mode enabled
@@ -236,14 +298,12 @@ def extract_doi_metadata(html):
     #pattern = r'<meta name="[^"]*doi[^"]*" content="doi:?(10\.\d{4,9}/[-._()/:A-Z0-9]+)"'
 
     # Check HTML meta tags for DOIs
-    pattern = r'<meta name=\".*\" content=\"(?:doi:)?(10\.\d{4,9}/[-._()/:a-zA-Z0-9]+)\"'
-    matches = list(set(re.findall(pattern, html, re.IGNORECASE)))
+    matches = list(set(_DOI_META_RE.findall(html)))
     if matches:
         return matches
     
     # Check HTML for DOIs a tag with class doi e.g., a.doi on https://www.sciencedirect.com/science/article/abs/pii/S1095643313002031
-    pattern = r'<a[^>]*class="[^"]*doi[^"]*"[^>]*href="https://doi.org/([^"]+)"'
-    matches = list(set(re.findall(pattern, html, re.IGNORECASE)))
+    matches = list(set(_DOI_LINK_RE.findall(html)))
     if matches:
         return matches
     
@@ -251,8 +311,7 @@ def extract_doi_metadata(html):
 
 def parse_dois(html, url, author):
     # Check rest of HTML for DOIs, note that some of these will be references to other papers and not the current paper
-    pattern = r"(?:https://doi.org/[^\/])?(10.\d{4,9}/[-._()/:a-zA-Z0-9]+)"
-    matches = list(set(re.findall(pattern, html, re.IGNORECASE)))
+    matches = list(set(_DOI_TEXT_RE.findall(html)))
     if matches:
         print_warn(f"MIGHT BE WRONG DOI: {matches}")
         # Check to see if DOI is valid and has author name in the html
@@ -278,7 +337,7 @@ def parse_dois(html, url, author):
             link = get_doi_link(doi)
             print_misc(link)
             html = get_url_content(link)
-            if author not in html:
+            if html is None or author not in html:
                 print_warn(f"Failed to verify DOI: Author not found in HTML of {link}")
                 continue
             return [doi]
@@ -338,21 +397,18 @@ def extract_doi_from_url(url):
     # https://journals.biologists.com/jeb/article-pdf/doi/10.1242/jeb.243973/2170187/jeb243973.pdf
     # https://www.frontiersin.org/articles/10.3389/fmars.2021.724913/full?trk=public_post_comment-text
     # doi_pattern = r'10\.\d{4,9}/[-._;()/:A-Z0-9]+(?![.][a-z]+)'
-    doi_pattern = r'10\.\d{4,9}/[-._;()/:A-Z0-9]+?(?=/|$|\.pdf)'
-    match = re.search(doi_pattern, url, re.IGNORECASE)
+    match = _DOI_URL_RE.search(url)
     if match and check_doi_via_api(match.group(), url): # Check if DOI is valid e.g., 10.1242/jeb.243973
         return match.group()
     
     # https://academic.oup.com/conphys/article-pdf/doi/10.1093/conphys/cox003/17644168/cox003.pdf
     # try adding one more slash to get 10.1093/conphys/cox003
-    doi_pattern_extended = r'10\.\d{4,9}/[-._;():A-Z0-9]+/[-._;():A-Z0-9]+'
-    match = re.search(doi_pattern_extended, url, re.IGNORECASE)
+    match = _DOI_URL_EXTENDED_RE.search(url)
     if match and check_doi_via_api(match.group(), url):
         return match.group()
     
-    doi_pattern_full = r'10\.\d{4,9}/[-._;()/:A-Z0-9]+'
     #doi_pattern_full = r'10\.\d{4,9}/[-._;()/:A-Z0-9]+(?=[.][a-z]+)'
-    match = re.search(doi_pattern_full, url, re.IGNORECASE)
+    match = _DOI_URL_FULL_RE.search(url)
     if match and check_doi_via_api(match.group(), url):
         return match.group()
 
@@ -363,18 +419,14 @@ def check_doi_via_redirect(doi, expected_url, expected_html, author, attempts=1)
     if not doi:
         return False
     
-    domain = 'doi.org'
-    if domain in last_scraped and time.time() - last_scraped[domain] < 30:
-        print_misc(f"Sleeping for 1 second to avoid being blocked by {domain}")
-        time.sleep(1)
-    last_scraped[domain] = time.time()
+    wait_for_domain('doi.org', 1)
 
     short_url = f"https://doi.org/{doi}"
     headers = {"User-Agent": "Googlebot/2.1 (+http://www.google.com/bot.html)"}
     req = urllib.request.Request(short_url, headers=headers)
     try:
         opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor())
-        response = opener.open(req, timeout=100)
+        response = opener.open(req, timeout=HTTP_READ_TIMEOUT)
         follow_url = response.geturl()
         page_html = response.read().decode('utf-8')
         response.close()
@@ -399,6 +451,8 @@ def check_doi_via_redirect(doi, expected_url, expected_html, author, attempts=1)
         #    return True
     except HTTPError as err:
         print_misc(f"HTTP error {err.code} for DOI {doi}: {err.reason}")
+    except (URLError, TimeoutError) as e:
+        print_misc(f"Failed to reach DOI {doi}: {e}")
     return False
 
 def has_captcha(html):
@@ -408,30 +462,29 @@ def has_captcha(html):
 
 @lru_cache(maxsize=1000)
 def get_doi_api(doi):
-    if not doi:
+    if not doi or not _DOI_PREFIX_RE.match(doi):
         return None
     
-    domain = 'doi.org'
-    if domain in last_scraped and time.time() - last_scraped[domain] < 30:
-        print_misc(f"Sleeping for 1 second to avoid being blocked by {domain}")
-        time.sleep(1)
-    last_scraped[domain] = time.time()
-
     # https://doi.org/api/handles/10.1242/jeb.243973
     api_url = f"https://doi.org/api/handles/{doi}"
     try:
         # Try loading json content from file
         data = load_html_from_file(api_url)
         if data:
-            return json.loads(data)
+            return orjson.loads(data)
         
-        with urllib.request.urlopen(api_url) as response:
-            data = json.load(response)
-            # Save html content to file
-            save_html_to_file(api_url, json.dumps(data, indent=4))
-            return data
-    except HTTPError as err:
-        print_error(f"HTTP error {err.code} for DOI {doi}: {err.reason}")
+        wait_for_domain('doi.org', 1)
+        response = api_session.get(api_url, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        # Cache the response body as-is; it is already JSON
+        save_html_to_file(api_url, response.content.decode("utf-8"))
+        return data
+    except requests.HTTPError as err:
+        print_error(f"HTTP error {err.response.status_code} for DOI {doi}: {err.response.reason}")
+        return None
+    except requests.RequestException as e:
+        print_error(f"Request error for DOI {doi}: {e}")
         return None
 
 def get_doi_resolved_link(doi):
@@ -477,15 +530,9 @@ def get_doi_link(doi):
 
 @lru_cache(maxsize=1000)
 def get_doi_short_api(doi):
-    if not doi:
+    if not doi or not _DOI_PREFIX_RE.match(doi):
         return None
     
-    domain = 'shortdoi.org'
-    if domain in last_scraped and time.time() - last_scraped[domain] < 30:
-        print_misc(f"Sleeping for 1 second to avoid being blocked by {domain}")
-        time.sleep(1)
-    last_scraped[domain] = time.time()
-
     # https://shortdoi.org/
     # e.g., https://shortdoi.org/10.1007/s10113-015-0832-z?format=json
     short_doi_url = f"https://shortdoi.org/{doi}?format=json"
@@ -493,18 +540,20 @@ def get_doi_short_api(doi):
         # Try loading json content from file
         data = load_html_from_file(short_doi_url)
         if data:
-            return json.loads(data)
+            return orjson.loads(data)
         
-        with urllib.request.urlopen(short_doi_url) as response:
-            data = json.load(response)
-            # Save html content to file
-            save_html_to_file(short_doi_url, json.dumps(data, indent=4))
-            return data
-    except HTTPError as err:
-        print_error(f"HTTP error {err.code} for short DOI {doi}: {err.reason}")
+        wait_for_domain('shortdoi.org', 1)
+        response = api_session.get(short_doi_url, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        # Cache the response body as-is; it is already JSON
+        save_html_to_file(short_doi_url, response.content.decode("utf-8"))
+        return data
+    except requests.HTTPError as err:
+        print_error(f"HTTP error {err.response.status_code} for short DOI {doi}: {err.response.reason}")
         return None
-    except URLError as e:
-        print_error(f"URL error {e.reason}")
+    except requests.ConnectionError as e:
+        print_error(f"URL error {e}")
         return None
     except Exception as e:
         print_error(f"get_doi_short_api() An error occurred: {e}")
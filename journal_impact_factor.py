@@ -1,35 +1,96 @@
+import os
+import json
+import time
+from functools import lru_cache
 from logger import print_error, print_warn, print_info
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 
 # Define the scope and authenticate
 scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
-creds = ServiceAccountCredentials.from_json_keyfile_name("./google-credentials.json", scope)
-client = gspread.authorize(creds)
 
 # Open the Google Sheet by URL
 sheet_url = "https://docs.google.com/spreadsheets/d/1lP75APkxXAgT8aobV4UjTR51BpX9Ee0wgYA7tTd-zrM/edit?gid=0"
-sheet = client.open_by_url(sheet_url).sheet1
+
+# Local copy of the sheet, reused until it is older than the TTL (in seconds)
+IMPACT_FACTOR_CACHE_FILE = "impact_factor_cache.json"
+IMPACT_FACTOR_CACHE_TTL = int(os.getenv("IMPACT_FACTOR_CACHE_TTL", 24 * 60 * 60))
+
+# Impact factors loaded on the first lookup and reused for the rest of the run
+impact_factor_dic = None
+
+@lru_cache(maxsize=1)
+def get_sheet():
+    """
+    Authenticate and open the Google Sheet on first use, so importing this module does not hit the network.
+    """
+    creds = ServiceAccountCredentials.from_json_keyfile_name("./google-credentials.json", scope)
+    client = gspread.authorize(creds)
+    return client.open_by_url(sheet_url).sheet1
+
+def load_cached_impact_factor():
+    """
+    Return the impact factor data saved by a previous load, or None if there is none or it has expired.
+    """
+    try:
+        with open(IMPACT_FACTOR_CACHE_FILE, "r") as f:
+            cached = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None # Missing or unreadable, so fetch the sheet again
+    if not isinstance(cached, dict):
+        return None
+    if time.time() - cached.get("fetched_at", 0) > IMPACT_FACTOR_CACHE_TTL:
+        return None
+    return cached.get("data")
+
+def save_cached_impact_factor(impact_factor_data):
+    """
+    Save the impact factor data with the time it was fetched, replacing the file atomically.
+    The temporary file is per process, so parallel test workers can't interleave their writes.
+    """
+    tmp_path = f"{IMPACT_FACTOR_CACHE_FILE}.tmp.{os.getpid()}"
+    with open(tmp_path, "w") as f:
+        json.dump({"fetched_at": time.time(), "data": impact_factor_data}, f)
+    os.replace(tmp_path, IMPACT_FACTOR_CACHE_FILE)
 
 def load_impact_factor():
     """
     Load the impact factor data from the Google Sheet and return it as a dictionary with lowercase keys.
+    A local copy younger than IMPACT_FACTOR_CACHE_TTL is used instead of the sheet when available.
     """
-    journal_names = sheet.col_values(1)[1:] # Column A (Journal names), excluding the header
-    impact_factors = sheet.col_values(2)[1:] # Column B (Impact factors), excluding the header
+    impact_factor_data = load_cached_impact_factor()
+    if impact_factor_data is not None:
+        print_info(f"Using impact factors cached in {IMPACT_FACTOR_CACHE_FILE}.")
+        return impact_factor_data
 
-    # Extend lists to match length
-    max_length = max(len(journal_names), len(impact_factors))
-    journal_names.extend([None] * (max_length - len(journal_names)))
-    impact_factors.extend([None] * (max_length - len(impact_factors)))
+    # Fetch the whole sheet in one request; rows are padded to the same length
+    rows = get_sheet().get_all_values()[1:] # Excluding the header
 
-    # Create a dictionary with lowercase journal names as keys
-    impact_factor_data = {journal_name.lower(): impact_factor for journal_name, impact_factor in zip(journal_names, impact_factors) if journal_name}
+    # Create a dictionary with lowercase journal names (column A) as keys and impact factors (column B) as values
+    impact_factor_data = {row[0].lower(): row[1] if len(row) > 1 else None for row in rows if row and row[0]}
 
+    save_cached_impact_factor(impact_factor_data)
     return impact_factor_data
 
+def get_impact_factor(journal_name):
+    """
+    Look up a journal's impact factor, loading the data only on the first call. Returns "" if the journal is not listed.
+    """
+    global impact_factor_dic
+    if impact_factor_dic is None:
+        impact_factor_dic = load_impact_factor()
+    return impact_factor_dic.get(journal_name.strip().lower(), "")
+
 def add_impact_factor(journal_name, impact_factor):
     """
     Add a new journal name and impact factor to the Google Sheet.
+    The local copy of the sheet is discarded, so the next load sees the new row (and any
+    impact factor filled in for it) instead of appending the journal again.
     """
-    sheet.append_row([journal_name, impact_factor])
\ No newline at end of file
+    get_sheet().append_row([journal_name, impact_factor])
+    if impact_factor_dic is not None:
+        impact_factor_dic[journal_name.strip().lower()] = impact_factor
+    try:
+        os.remove(IMPACT_FACTOR_CACHE_FILE)
+    except FileNotFoundError:
+        pass
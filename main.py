@@ -2,14 +2,28 @@
 
 import sys
 import time
-import json
+import orjson
 import os
+from concurrent.futures import ThreadPoolExecutor
 from scholarly import scholarly
 from journal_impact_factor import load_impact_factor, add_impact_factor
 from doi import get_doi, get_doi_from_title, get_doi_link, get_doi_resolved_link, get_doi_short, get_doi_short_link, are_urls_equal
 from standardise import standardise_authors
 from logger import print_error, print_warn, print_info, print_misc
 
+def save_author(path, author):
+    """
+    Write the author data to a temporary file and atomically swap it into place,
+    so a crash mid-write never leaves a truncated JSON file behind. The data is
+    flushed to disk before the swap, so a power loss can't leave an empty file either.
+    """
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(author, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
 if not len(sys.argv) == 2:
     print_error("Usage: python main.py scholar_id\nExample: python main.py ynWS968AAAAJ")
     sys.exit(1)
@@ -17,15 +31,17 @@ if not len(sys.argv) == 2:
 scholar_id = sys.argv[1]
 
 journal_impact_factor_dic = load_impact_factor()
-print_info(f"Loaded {len(journal_impact_factor_dic)} impact factors from Google Sheet.")
+print_info(f"Loaded {len(journal_impact_factor_dic)} impact factors.")
 
 # Load previous data, if available
 previous_data = {}
 file_path = os.path.join("scholar_data", f"{scholar_id}.json")
-if os.path.exists(file_path):
-    with open(file_path, "r") as f:
-        previous_data = json.load(f)
+try:
+    with open(file_path, "rb") as f:
+        previous_data = orjson.loads(f.read())
         print_info(f"Loaded previous data for {scholar_id}.")
+except FileNotFoundError:
+    pass
 
 try:
     print_misc(f"Getting author with ID: {scholar_id}")
@@ -36,22 +52,24 @@ try:
         sys.exit(1) # Exit if no author found
 
     author = scholarly.fill(author)
-    filled_publications = []
+    # Filled publications replace their unfilled entry in place, so progress saves include them
+    publications = author["publications"]
+    previous_publications = previous_data.get('publications', [])
 
     # Process each publication
-    for index, pub in enumerate(author["publications"]):
+    for index, pub in enumerate(publications):
         # Publication number of the publications
-        print_misc(f"Processing publication {index+1}/{len(author['publications'])}: {pub['bib']['title']}")
+        print_misc(f"Processing publication {index+1}/{len(publications)}: {pub['bib']['title']}")
 
         # If already in json file, get data from there but use new Impact Factor.
-        if previous_data.get('publications', []) and len(previous_data.get('publications', [])) > index:
-            filled_pub = previous_data.get('publications', [])[index]
+        if len(previous_publications) > index:
+            filled_pub = previous_publications[index]
             print_misc(f"Data already found for {filled_pub.get('pub_url', filled_pub.get('bib', {}).get('title', ''))}. Using existing data but updating Impact Factor.")
             journal_name = filled_pub.get('bib', {}).get('journal', '') if filled_pub.get('bib', {}).get('journal', '') != "Null" else ''
             journal_name = journal_name.strip().lower()
             if journal_name in journal_impact_factor_dic:
                 filled_pub['bib']['impact_factor'] = journal_impact_factor_dic[journal_name]
-            filled_publications.append(filled_pub)
+            publications[index] = filled_pub
             continue
 
         filled_pub = scholarly.fill(pub)
@@ -73,28 +91,26 @@ try:
             filled_pub['doi_short_link'] = ""
             filled_pub['bib']['impact_factor'] = ""
         else:
-            # Get DOI
+            # Get DOI. Publications with previous data were handled above, so everything here is resolved from scratch
             print_misc(f"Getting DOI for {pub_url}")
-
-            # Get DOI from previous data, if available
-            doi = previous_data.get('publications', [])[index].get('doi', '') if previous_data.get('publications', []) else None
+            doi_link = resolved_link = doi_short = doi_short_link = None
 
             # e.g., https://scholar.google.com/scholar?cluster=4186906934658759747&hl=en&oi=scholarr
             #host = urlparse(url).hostname
             #if host and host.endswith("scholar.google.com"):
-            if not doi:
-                if "scholar.google.com" in pub_url and pub_title:
-                    doi = get_doi_from_title(pub_title, author['name'].split()[-1])
-                else:
-                    doi = get_doi(pub_url, author['name'].split()[-1])
+            if "scholar.google.com" in pub_url and pub_title:
+                doi = get_doi_from_title(pub_title, author['name'].split()[-1])
+            else:
+                doi = get_doi(pub_url, author['name'].split()[-1])
             if not doi:
                 print_warn("DOI not found. Trying to get DOI from the publication title.")
             else:
                 print_info(f"DOI: {doi}")
 
-                # Get doi_link from previous data, if available
-                doi_link = previous_data.get('publications', [])[index].get('doi_link', '') if previous_data.get('publications', []) else None
-                if not doi_link:
+                # The shortdoi.org lookup doesn't depend on the doi.org ones, so run it alongside them
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    doi_short_future = executor.submit(get_doi_short, doi)
+
                     doi_link = get_doi_link(doi)
                     print_misc(f"DOI link: {doi_link}")
                     resolved_link = get_doi_resolved_link(doi)
@@ -102,16 +118,9 @@ try:
                     if not are_urls_equal(pub_url, resolved_link):
                         print_warn(f"Resolved link does not match publication URL:\n{pub_url}\n{resolved_link}")
 
-                # Get doi_short from previous data, if available
-                doi_short = previous_data.get('publications', [])[index].get('doi_short', '') if previous_data.get('publications', []) else None
-                if not doi_short:
-                    doi_short = get_doi_short(doi)
-                    print_misc(f"Short DOI: {doi_short}")
-
-                # Get doi_short_link from previous data, if available
-                doi_short_link = previous_data.get('publications', [])[index].get('doi_short_link', '') if previous_data.get('publications', []) else None
-                if not doi_short_link:
-                    doi_short_link = get_doi_short_link(doi_short)
+                    doi_short = doi_short_future.result()
+                print_misc(f"Short DOI: {doi_short}")
+                doi_short_link = get_doi_short_link(doi_short)
 
             # Add DOI and Impact Factor to publication
             filled_pub['doi'] = doi if doi else ""
@@ -137,22 +146,17 @@ try:
                 print_warn("Journal name not found.")
             filled_pub['bib']['impact_factor'] = impact_factor
 
-        # Add to list of processed publications
-        filled_publications.append(filled_pub)
+        # Replace with the processed publication
+        publications[index] = filled_pub
 
         # Save progress
-        with open(f"{scholar_id}.json", "w") as f:
-            json.dump(author, f, indent=4)
+        save_author(f"{scholar_id}.json", author)
         
         print_misc("Sleeping for 1 second... Being polite with the rate of requests to Google Scholar.")
         time.sleep(1)
 
-    # Update the author data with processed publications
-    author["publications"] = filled_publications
-    
     # Write author to file in JSON format
-    with open(file_path, "w") as f:
-        json.dump(author, f, indent=4)
+    save_author(file_path, author)
     print_info(f"DONE. Author data written to {scholar_id}.json")
 
 except AttributeError as e:
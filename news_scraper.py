@@ -1,6 +1,7 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 import os
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
@@ -10,28 +11,32 @@ NEWS_API_ORG_KEY = os.getenv("NEWS_API_ORG_KEY")
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 GOOGLE_CX_ID = os.getenv("GOOGLE_CX_ID")
 
-DELAY = 1.5 # Delay between requests to avoid overwhelming servers
-
 SCHOLAR_NAME = "Professor Dr Jodie Rummer"
 RESULTS_FILE = f"{SCHOLAR_NAME.replace(' ', '_')}_portfolio.json"
 
+# Shared session so connections are kept alive and reused across requests
+SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
 def fetch_news_api(query, api_key):
     url = f"https://newsapi.org/v2/everything?q={query}&apiKey={api_key}"
-    response = requests.get(url)
+    response = SESSION.get(url)
     response.raise_for_status()  # Check for HTTP errors
     return response.json()["articles"]
 
 def fetch_google_search(query, api_key, cx):
     url = f"https://www.googleapis.com/customsearch/v1?q={query}&key={api_key}&cx={cx}"
-    response = requests.get(url)
+    response = SESSION.get(url)
     response.raise_for_status()
     return response.json()["items"]
 
 def scrape_web_content(url):
     headers = {"User-Agent": "Mozilla/5.0"}
-    response = requests.get(url, headers=headers)
+    response = SESSION.get(url, headers=headers)
     response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(response.text, "lxml")
     articles = []
     for article in soup.find_all("div", class_="article"):
         title = article.find("h2").get_text()
@@ -47,26 +52,26 @@ def scrape_web_content(url):
 def main(SEARCH_TERMS):
     portfolio_data = {"news_articles": [], "interviews": [], "podcasts": []}
     
-    # Fetch articles from NewsAPI
-    print("Fetching news articles...")
-    news_articles = fetch_news_api(SEARCH_TERMS, NEWS_API_ORG_KEY)
-    portfolio_data["news_articles"].extend(news_articles)
-    time.sleep(DELAY)
+    # Each source is a different host, so request them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        print("Fetching news articles...")
+        news_future = executor.submit(fetch_news_api, SEARCH_TERMS, NEWS_API_ORG_KEY)
+        print("Fetching Google search results...")
+        google_future = executor.submit(fetch_google_search, SEARCH_TERMS, GOOGLE_API_KEY, GOOGLE_CX_ID)
+        # Example scrape (customised for specific site structure)
+        print("Scraping additional sources...")
+        scrape_future = executor.submit(scrape_web_content, SEARCH_TERMS)
+
+        # Fetch articles from NewsAPI
+        portfolio_data["news_articles"].extend(news_future.result())
 
-    # Fetch data from Google Custom Search API
-    print("Fetching Google search results...")
-    try:
-        google_results = fetch_google_search(SEARCH_TERMS, GOOGLE_API_KEY, GOOGLE_CX_ID)
-        portfolio_data["interviews"].extend(google_results)
-    except requests.HTTPError as e:
-        print(f"Failed to fetch Google results: {e}")
-    time.sleep(DELAY)
+        # Fetch data from Google Custom Search API
+        try:
+            portfolio_data["interviews"].extend(google_future.result())
+        except requests.HTTPError as e:
+            print(f"Failed to fetch Google results: {e}")
 
-    # Example scrape (customised for specific site structure)
-    print("Scraping additional sources...")
-    additional_articles = scrape_web_content(SEARCH_TERMS)
-    portfolio_data["news_articles"].extend(additional_articles)
-    time.sleep(DELAY)
+        portfolio_data["news_articles"].extend(scrape_future.result())
 
     # Save results to a JSON file
     with open(RESULTS_FILE, "w") as file:
@@ -2,11 +2,15 @@ import feedparser
 import json
 import re
 import os
-import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional, TypedDict, Literal
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple, TypedDict, Literal
 from urllib.parse import urljoin, urlparse, parse_qs
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from email.utils import parsedate_to_datetime
@@ -16,15 +20,19 @@ load_dotenv()
 
 # Constants
 REVALIDATE_TIME = 604800  # One week in seconds
+FEED_CACHE_DIR = "feed_cache"  # Last copy of each feed, used to revalidate with conditional GETs
+MAX_FETCH_WORKERS = 8  # Number of news sources fetched concurrently
 SCHOLAR_NAME = "Professor Dr Jodie Rummer"
 
 DEFAULT_HEADERS = {
     'Accept': 'application/atom+xml,application/xml,text/xml,application/rss+xml',
+    'Accept-Encoding': 'gzip, deflate, br',
     'User-Agent': 'Mozilla/5.0 (compatible; RummerLab/1.0; +https://rummerlab.org)'
 }
 
 MODERN_HEADERS = {
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     'Referer': 'https://www.townsvillebulletin.com.au',
     'Sec-Fetch-Dest': 'document',
@@ -34,6 +42,40 @@ MODERN_HEADERS = {
     'Upgrade-Insecure-Requests': '1'
 }
 
+# Shared session so connections are kept alive and pooled across sources,
+# with transient server errors retried by urllib3. Backoff doubles per attempt up to a cap,
+# with jitter so parallel fetches to the same host don't retry in lockstep
+SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5, backoff_max=30, backoff_jitter=0.5,
+                      status_forcelist=[502, 503, 504])
+)
+SESSION.mount('https://', _ADAPTER)
+SESSION.mount('http://', _ADAPTER)
+
+# Precompiled patterns used for every feed entry
+_TAG_OR_ENTITY_RE = re.compile(r'<[^>]+>|&[^;]+;')
+_WS_RE = re.compile(r'\s+')
+_PREFIX_RE = re.compile(r'^(Exclusive|Live):\s*', re.IGNORECASE)
+_IMG_SRC_RE = re.compile(r'<img[^>]+src="([^">]+)"')
+_HREF_RE = re.compile(r'href="([^"]+)"')
+_ISO_DATE_SHAPE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+KNOWN_SOURCE_TYPES = frozenset({'The Guardian', 'The Conversation', 'ABC News', 'CNN'})
+
+# Tuples, since the compiled patterns below would not pick up later changes to these
+DR_RUMMER_MENTIONS = ('dr rummer', 'dr. rummer', 'professor rummer', 'jodie rummer')
+MARINE_KEYWORDS = ('marine', 'reef', 'shark', 'fish', 'ocean')
+EXCLUDED_HEADLINE_TERMS = ('live updates', 'as it happened', 'live blog', 'live coverage',
+                           'live report', 'live reaction', 'live news', 'crossword')
+
+# Each keyword list is matched with a single alternation rather than one scan per keyword
+_DR_RUMMER_RE = re.compile('|'.join(map(re.escape, DR_RUMMER_MENTIONS)))
+_MARINE_RE = re.compile('|'.join(map(re.escape, MARINE_KEYWORDS)))
+_EXCLUDED_HEADLINE_RE = re.compile('|'.join(map(re.escape, EXCLUDED_HEADLINE_TERMS)))
+
 class MediaItem(TypedDict):
     type: Literal['article']
     source: str
@@ -46,40 +88,76 @@ class MediaItem(TypedDict):
 
 def strip_html(html: str) -> str:
     """Remove HTML tags and entities from text."""
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', html)
-    # Remove HTML entities
-    text = re.sub(r'&[^;]+;', '', text)
+    # Remove HTML tags and entities in one pass
+    text = _TAG_OR_ENTITY_RE.sub('', html)
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
     # Remove "Exclusive:" or "Live:" prefix
-    text = re.sub(r'^(Exclusive|Live):\s*', '', text, flags=re.IGNORECASE)
+    text = _PREFIX_RE.sub('', text)
     return text.strip()
 
 def extract_image_from_content(content: str) -> Optional[str]:
     """Extract image URL from HTML content."""
-    match = re.search(r'<img[^>]+src="([^">]+)"', content or '')
+    match = _IMG_SRC_RE.search(content or '')
     return match.group(1) if match else None
 
 def does_article_mention_rummer(content: str, title: str, description: str) -> bool:
     """Check if article mentions Rummer in a meaningful way."""
+    # Title and description are short, so check them before lowercasing the
+    # (potentially full article) content, which is only done once.
+    if 'rummer' in title.lower() or 'rummer' in description.lower():
+        return True
+
     normalized_content = content.lower()
-    normalized_title = title.lower()
-    normalized_description = description.lower()
-    
     return (
-        'rummer' in normalized_title or 
-        'rummer' in normalized_description or 
-        ('rummer' in normalized_content and 
-         (normalized_content.count('rummer') > 1 or
-          any(term in normalized_content for term in ['dr rummer', 'dr. rummer', 'professor rummer', 'jodie rummer'])))
+        'rummer' in normalized_content and
+        (normalized_content.count('rummer') > 1 or
+         bool(_DR_RUMMER_RE.search(normalized_content)))
     )
 
 def contains_marine_keywords(content: str, title: str, description: str) -> bool:
     """Check if content contains marine-related keywords."""
     text = f"{content} {title} {description}".lower()
-    keywords = ['marine', 'reef', 'shark', 'fish', 'ocean']
-    return any(keyword in text for keyword in keywords)
+    return bool(_MARINE_RE.search(text))
+
+def _parse_iso(date_str: str) -> datetime:
+    return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> Optional[str]:
+    """Parse a date string to ISO 8601 UTC, or return None if no known format matches."""
+    # Try the parser that fits the string's shape first, so the common case
+    # doesn't pay for the other parser raising. Feeds often repeat timestamps,
+    # hence the cache.
+    if _ISO_DATE_SHAPE_RE.match(date_str):
+        parsers = (_parse_iso, parsedate_to_datetime)
+    else:
+        parsers = (parsedate_to_datetime, _parse_iso)
+    for parser in parsers:
+        try:
+            dt = parser(date_str)
+            return dt.astimezone(pytz.UTC).isoformat().replace('+00:00', 'Z')
+        except:
+            pass
+
+    # Try common formats
+    for fmt in [
+        '%Y-%m-%d %H:%M:%S',
+        '%Y-%m-%d %H:%M:%S%z',
+        '%Y-%m-%dT%H:%M:%S',
+        '%Y-%m-%d',
+        '%d/%m/%Y %H:%M:%S',
+        '%d/%m/%Y',
+    ]:
+        try:
+            dt = datetime.strptime(date_str, fmt)
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=pytz.UTC)
+            return dt.astimezone(pytz.UTC).isoformat().replace('+00:00', 'Z')
+        except:
+            continue
+
+    return None
 
 def standardize_date(date_str: Optional[str]) -> str:
     """
@@ -90,36 +168,9 @@ def standardize_date(date_str: Optional[str]) -> str:
         return datetime.now(pytz.UTC).isoformat().replace('+00:00', 'Z')
     
     try:
-        # Try parsing as RFC 2822 (common in RSS feeds)
-        try:
-            dt = parsedate_to_datetime(date_str)
-            return dt.astimezone(pytz.UTC).isoformat().replace('+00:00', 'Z')
-        except:
-            pass
-        
-        # Try parsing as ISO format
-        try:
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            return dt.astimezone(pytz.UTC).isoformat().replace('+00:00', 'Z')
-        except:
-            pass
-        
-        # Try common formats
-        for fmt in [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d %H:%M:%S%z',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%d',
-            '%d/%m/%Y %H:%M:%S',
-            '%d/%m/%Y',
-        ]:
-            try:
-                dt = datetime.strptime(date_str, fmt)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=pytz.UTC)
-                return dt.astimezone(pytz.UTC).isoformat().replace('+00:00', 'Z')
-            except:
-                continue
+        standardized = _parse_date(date_str)
+        if standardized:
+            return standardized
                 
         # If all parsing attempts fail, use current time
         return datetime.now(pytz.UTC).isoformat().replace('+00:00', 'Z')
@@ -127,19 +178,76 @@ def standardize_date(date_str: Optional[str]) -> str:
         print(f"Error standardizing date {date_str}: {e}")
         return datetime.now(pytz.UTC).isoformat().replace('+00:00', 'Z')
 
+def get_feed_cache_paths(url: str) -> Tuple[str, str]:
+    """Generate the cache file paths (validators, raw body) for a feed based on a hash of its URL."""
+    hash_url = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    base_path = os.path.join(FEED_CACHE_DIR, hash_url)
+    return f"{base_path}.json", f"{base_path}.xml"
+
+def write_feed_cache_file(path: str, data: bytes) -> None:
+    """Write a feed cache file via a temporary file, so an interrupted run never leaves it truncated."""
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def fetch_feed_content(url: str, headers=DEFAULT_HEADERS) -> bytes:
+    """
+    Fetch a feed's raw body, revalidating the cached copy with If-None-Match /
+    If-Modified-Since so an unchanged feed is not downloaded again.
+    The bytes are handed to feedparser as-is, which reads the encoding from the
+    XML declaration, so the body is never decoded into a separate str copy.
+    """
+    meta_path, body_path = get_feed_cache_paths(url)
+    cached = None
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (FileNotFoundError, ValueError):
+        pass  # No usable validators; fetch unconditionally
+
+    request_headers = dict(headers)
+    if cached:
+        if cached.get('etag'):
+            request_headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            request_headers['If-Modified-Since'] = cached['last_modified']
+
+    response = SESSION.get(url, headers=request_headers, timeout=30)
+    if response.status_code == 304 and cached:
+        try:
+            with open(body_path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            # Validators without a body; fetch unconditionally
+            response = SESSION.get(url, headers=headers, timeout=30)
+    response.raise_for_status()
+
+    content = response.content
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        os.makedirs(FEED_CACHE_DIR, exist_ok=True)
+        # Body first, so validators are only ever saved alongside a complete body
+        write_feed_cache_file(body_path, content)
+        write_feed_cache_file(meta_path, json.dumps({'etag': etag, 'last_modified': last_modified}).encode('utf-8'))
+    return content
+
 def fetch_rss_feed(url: str, source: str, filter_fn=None, headers=DEFAULT_HEADERS) -> List[MediaItem]:
     """Fetch and parse an RSS feed."""
     try:
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        feed = feedparser.parse(response.text)
+        feed = feedparser.parse(fetch_feed_content(url, headers))
         
+        source_type = source if source in KNOWN_SOURCE_TYPES else 'Other'
         articles = []
         for item in feed.entries:
+            # Nothing to match or show for entries without a title or description
+            if not (item.get('title') or item.get('description')):
+                continue
             if filter_fn and not filter_fn(item):
                 continue
                 
+            title = strip_html(item.title)
             content = getattr(item, 'content', [{}])[0].get('value', '') if hasattr(item, 'content') else ''
             description = getattr(item, 'description', '') or getattr(item, 'summary', '')
             
@@ -149,11 +257,11 @@ def fetch_rss_feed(url: str, source: str, filter_fn=None, headers=DEFAULT_HEADER
             media_item: MediaItem = {
                 'type': 'article',
                 'source': source,
-                'title': strip_html(item.title),
+                'title': title,
                 'description': strip_html(description),
                 'url': item.link,
                 'date': standardize_date(date_str),
-                'sourceType': source if source in ['The Guardian', 'The Conversation', 'ABC News', 'CNN'] else 'Other'
+                'sourceType': source_type
             }
             
             # Add image if available
@@ -162,14 +270,14 @@ def fetch_rss_feed(url: str, source: str, filter_fn=None, headers=DEFAULT_HEADER
                 if 'url' in enclosure:
                     media_item['image'] = {
                         'url': enclosure.url,
-                        'alt': strip_html(item.title)
+                        'alt': title
                     }
             elif content:
                 image_url = extract_image_from_content(content)
                 if image_url:
                     media_item['image'] = {
                         'url': image_url,
-                        'alt': strip_html(item.title)
+                        'alt': title
                     }
                     
             articles.append(media_item)
@@ -221,7 +329,7 @@ def fetch_guardian_articles() -> List[MediaItem]:
             'show-fields': 'headline,trailText,thumbnail,bodyText',
             'api-key': api_key
         }
-        response = requests.get(url, params=params)
+        response = SESSION.get(url, params=params)
         response.raise_for_status()
         data = response.json()
         
@@ -235,15 +343,14 @@ def fetch_guardian_articles() -> List[MediaItem]:
                 continue
                 
             # Skip blog posts and live updates
-            if any(term in article['fields'].get('headline', '').lower() for term in 
-                  ['live updates', 'as it happened', 'live blog', 'live coverage',
-                   'live report', 'live reaction', 'live news', 'crossword']):
+            if _EXCLUDED_HEADLINE_RE.search(article['fields'].get('headline', '').lower()):
                 continue
                 
+            title = strip_html(article['fields']['headline'])
             media_item: MediaItem = {
                 'type': 'article',
                 'source': 'The Guardian',
-                'title': strip_html(article['fields']['headline']),
+                'title': title,
                 'description': strip_html(article['fields'].get('trailText', '')),
                 'url': article['webUrl'],
                 'date': article['webPublicationDate'],
@@ -253,7 +360,7 @@ def fetch_guardian_articles() -> List[MediaItem]:
             if article['fields'].get('thumbnail'):
                 media_item['image'] = {
                     'url': article['fields']['thumbnail'],
-                    'alt': strip_html(article['fields']['headline'])
+                    'alt': title
                 }
                 
             articles.append(media_item)
@@ -265,14 +372,14 @@ def fetch_guardian_articles() -> List[MediaItem]:
 
 def fetch_townsville_bulletin_articles() -> List[MediaItem]:
     try:
-        response = requests.get(
+        response = SESSION.get(
             'https://www.townsvillebulletin.com.au/news/townsville',
             headers=MODERN_HEADERS,
             timeout=30
         )
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         articles = []
         
         for article in soup.find_all('article'):
@@ -418,14 +525,9 @@ def fix_google_news_url(url: str) -> str:
 
 def fetch_google_news_articles() -> List[MediaItem]:
     try:
-        response = requests.get(
-            'https://news.google.com/rss/search?q=Jodie+Rummer+OR+Great+Barrier+Reef+OR+James+Cook+University&hl=en-AU&gl=AU&ceid=AU:en',
-            headers=DEFAULT_HEADERS,
-            timeout=30
-        )
-        response.raise_for_status()
-        
-        feed = feedparser.parse(response.text)
+        feed = feedparser.parse(fetch_feed_content(
+            'https://news.google.com/rss/search?q=Jodie+Rummer+OR+Great+Barrier+Reef+OR+James+Cook+University&hl=en-AU&gl=AU&ceid=AU:en'
+        ))
         articles = []
         
         for item in feed.entries:
@@ -438,7 +540,7 @@ def fetch_google_news_articles() -> List[MediaItem]:
             # Get URL from description if available, as it contains the direct link
             desc_url = None
             if description:
-                url_match = re.search(r'href="([^"]+)"', description)
+                url_match = _HREF_RE.search(description)
                 if url_match:
                     desc_url = url_match.group(1)
             
@@ -447,10 +549,11 @@ def fetch_google_news_articles() -> List[MediaItem]:
             # Get the most accurate date available
             date_str = item.get('published', '') or item.get('updated', '') or item.get('created', '')
             
+            title = strip_html(item.title)
             media_item: MediaItem = {
                 'type': 'article',
                 'source': 'Google News',
-                'title': strip_html(item.title),
+                'title': title,
                 'description': strip_html(description),
                 'url': url,
                 'date': standardize_date(date_str),
@@ -462,7 +565,7 @@ def fetch_google_news_articles() -> List[MediaItem]:
                 if 'url' in enclosure:
                     media_item['image'] = {
                         'url': enclosure.url,
-                        'alt': strip_html(item.title)
+                        'alt': title
                     }
             
             articles.append(media_item)
@@ -487,7 +590,7 @@ def fetch_newsapi_articles() -> List[MediaItem]:
             'apiKey': api_key
         }
         
-        response = requests.get(url, params=params, timeout=30)
+        response = SESSION.get(url, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
         
@@ -538,14 +641,16 @@ def fetch_all_news() -> List[MediaItem]:
         fetch_newsapi_articles
     ]
     
+    # Each source is network-bound, so fetch them concurrently. Results are
+    # collected in the order above so de-duplication stays deterministic.
     all_articles = []
-    for fetch_fn in fetch_functions:
-        try:
-            articles = fetch_fn()
-            all_articles.extend(articles)
-            time.sleep(1)  # Be nice to the servers
-        except Exception as e:
-            print(f"Error in {fetch_fn.__name__}: {str(e)}")
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        futures = [(fetch_fn, executor.submit(fetch_fn)) for fetch_fn in fetch_functions]
+        for fetch_fn, future in futures:
+            try:
+                all_articles.extend(future.result())
+            except Exception as e:
+                print(f"Error in {fetch_fn.__name__}: {str(e)}")
             
     # Remove duplicates based on URL and sort by date
     seen_urls = set()
@@ -564,10 +669,10 @@ def main():
     
     # Load existing portfolio data
     portfolio_file = f"{SCHOLAR_NAME.replace(' ', '_')}_portfolio.json"
-    if os.path.exists(portfolio_file):
+    try:
         with open(portfolio_file, 'r') as f:
             portfolio_data = json.load(f)
-    else:
+    except FileNotFoundError:
         portfolio_data = {}
         
     # Update media section
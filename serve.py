@@ -1,19 +1,51 @@
+import gzip
 import os
-import json
-from flask import Flask, jsonify, send_from_directory
-import re
+from functools import lru_cache
+from flask import Flask, Response, request
+import orjson
+import string
 
 app = Flask(__name__)
 
+# How long clients and proxies may reuse a scholar response. The data is regenerated every two weeks,
+# but a shorter lifetime picks up a refresh sooner, and revalidating with the ETag is cheap
+SCHOLAR_MAX_AGE = 86400
+
+# Google Scholar IDs are 12 characters of letters, digits, "_" or "-"
+_SCHOLAR_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+def json_response(data, status=200):
+    """
+    Build a JSON response with orjson, which serialises much faster than flask.jsonify.
+    """
+    return Response(orjson.dumps(data), status=status, mimetype="application/json")
+
+@lru_cache(maxsize=256)
+def load_scholar_bytes(path, mtime_ns, size):
+    """
+    Load a scholar's JSON file as raw bytes, along with a gzipped copy. The file is
+    already valid JSON, so it is served as-is rather than parsed and re-serialised.
+    Cached on the file's modification time and size, so it is only re-read and
+    compressed again after it has been rewritten.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    return data, gzip.compress(data, compresslevel=6)
+
+# Read the favicon once at startup, since every new browser session asks for it
+try:
+    with open(os.path.join(app.root_path, "favicon.ico"), "rb") as f:
+        favicon_bytes = f.read()
+except FileNotFoundError:
+    favicon_bytes = None
+
 @app.route("/favicon.ico", methods=["GET"])
 def favicon():
-    try:
-        return send_from_directory(
-            os.path.join(os.path.dirname(app.root_path), ""), "favicon.ico"
-        )
-    except Exception as e:
-        print(e)
-        return "An internal error has occurred!"
+    if favicon_bytes is None:
+        return "", 204
+    response = Response(favicon_bytes, mimetype="image/x-icon")
+    response.headers["Cache-Control"] = "public, max-age=604800"
+    return response
 
 @app.route("/", methods=["GET"])
 def index():
@@ -22,17 +54,32 @@ def index():
 @app.route("/scholar/<id>", methods=["GET"])
 def search_author_id(id):
     if id != "ynWS968AAAAJ":
-        return jsonify({"error": "Author not found"}), 400
+        return json_response({"error": "Author not found"}, 400)
     if not id:
-        return jsonify({"error": "Missing id"}), 400
-    if len(id) != 12 or not re.match("^[a-zA-Z0-9_-]+$", id):
-        return jsonify({"error": "Invalid id"}), 400
+        return json_response({"error": "Missing id"}, 400)
+    if len(id) != 12 or not _SCHOLAR_ID_CHARS.issuperset(id):
+        return json_response({"error": "Invalid id"}, 400)
     try:
-        with open(os.path.join("scholar_data", f"{id}.json"), "r") as f:
-            data = json.load(f)
-            return jsonify(data)
+        path = os.path.join("scholar_data", f"{id}.json")
+        st = os.stat(path)
+        # Weak validator from the file's mtime and size, so unchanged data is answered with a 304
+        etag = f"{st.st_mtime_ns:x}-{st.st_size:x}"
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            data, gzipped = load_scholar_bytes(path, st.st_mtime_ns, st.st_size)
+            if request.accept_encodings["gzip"]:
+                response = Response(gzipped, mimetype="application/json")
+                response.headers["Content-Encoding"] = "gzip"
+            else:
+                response = Response(data, mimetype="application/json")
+        response.set_etag(etag, weak=True)
+        response.last_modified = st.st_mtime
+        response.headers["Cache-Control"] = f"public, max-age={SCHOLAR_MAX_AGE}"
+        response.headers["Vary"] = "Accept-Encoding"
+        return response.make_conditional(request)
     except FileNotFoundError:
-        return jsonify({"error": "Author not found"}), 404
+        return json_response({"error": "Author not found"}, 404)
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=False)
\ No newline at end of file
+    app.run(host="0.0.0.0", port=5000, debug=False)
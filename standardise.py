@@ -1,50 +1,83 @@
-import numpy as np
+import re
+from functools import lru_cache
+
+# Optional: with rapidfuzz installed the distance is computed in native code,
+# otherwise the pure Python version below is used
+try:
+    from rapidfuzz.distance import Levenshtein as rapidfuzz_levenshtein
+except ImportError:
+    rapidfuzz_levenshtein = None
+
+# Authors are separated by " and " in the bib entries, sometimes with extra whitespace
+_AUTHOR_SEPARATOR_RE = re.compile(r"\s+and\s+")
 
 # https://stackoverflow.com/questions/41005700/function-that-returns-capitalized-initials-of-name
+# Co-authors repeat across a scholar's publications, so each name is only initialised once
+@lru_cache(maxsize=8192)
 def initialize(fullname):
-    xs = fullname
-    name_list = xs.split()
-    surname = name_list[-1]
-    initials = ""
-    for name in name_list:  # go through each name
-        if name != surname:
-            initials += name[0].upper() + "."
-            if name != name_list[-2]:
-                initials += " "  # append a space except for the end one
-        else:
-            initials = surname.title() + ", " + initials  # prepend the surname
-    return initials
+    name_list = fullname.split()
+    if not name_list:
+        return ""
+    initials = " ".join(f"{name[0].upper()}." for name in name_list[:-1])
+    return f"{name_list[-1].title()}, {initials}"
 
 # Get authors in a usable format
 def standardise_authors(authors):  # prettify_authors
-    author_list = authors.lower().split(" and ")
-    authors = ""
-    for a in author_list:
-        if a != author_list[0]:
-            authors += ", "
-        authors += initialize(a)
-        # et al.
-    return authors
+    # et al.
+    return ", ".join(initialize(a) for a in _AUTHOR_SEPARATOR_RE.split(authors.lower()))
 
 
 # https://stackabuse.com/levenshtein-distance-and-text-similarity-in-python/
-def levenshtein(seq1, seq2):
-    size_x = len(seq1) + 1
-    size_y = len(seq2) + 1
-    matrix = np.zeros((size_x, size_y))
-    for x in range(size_x):
-        matrix[x, 0] = x
-    for y in range(size_y):
-        matrix[0, y] = y
-
-    for x in range(1, size_x):
-        for y in range(1, size_y):
-            if seq1[x - 1] == seq2[y - 1]:
-                matrix[x, y] = min(
-                    matrix[x - 1, y] + 1, matrix[x - 1, y - 1], matrix[x, y - 1] + 1
-                )
-            else:
-                matrix[x, y] = min(
-                    matrix[x - 1, y] + 1, matrix[x - 1, y - 1] + 1, matrix[x, y - 1] + 1
-                )
-    return matrix[size_x - 1, size_y - 1]
+# Only the previous row of the matrix is needed to fill the next one, so update a single row in place
+# With max_dist set, any distance greater than it is returned as max_dist + 1
+def levenshtein(seq1, seq2, max_dist=None):
+    # The distance is at least the difference in length, so skip the work when that is already too far
+    if max_dist is not None and abs(len(seq1) - len(seq2)) > max_dist:
+        return max_dist + 1
+    if rapidfuzz_levenshtein is not None:
+        return rapidfuzz_levenshtein.distance(seq1, seq2, score_cutoff=max_dist)
+    distance = _levenshtein_python(seq1, seq2)
+    if max_dist is not None and distance > max_dist:
+        return max_dist + 1  # same as rapidfuzz's score_cutoff
+    return distance
+
+def _levenshtein_python(seq1, seq2):
+    if len(seq1) < len(seq2):
+        seq1, seq2 = seq2, seq1  # keep the rows as short as possible
+    if len(seq2) <= 64:
+        return _levenshtein_bit_parallel(seq2, seq1)
+    row = list(range(len(seq2) + 1))
+    for x, c1 in enumerate(seq1, 1):
+        diagonal, row[0] = row[0], x
+        for y, c2 in enumerate(seq2, 1):
+            above = row[y]
+            row[y] = diagonal if c1 == c2 else 1 + min(above, diagonal, row[y - 1])
+            diagonal = above
+    return row[-1]
+
+# Myers' bit-parallel algorithm (Hyyrö's formulation): a whole column of the matrix is
+# held in the bits of an int, so there is one loop iteration per item of text
+def _levenshtein_bit_parallel(pattern, text):
+    if not pattern:
+        return len(text)
+    peq = {}
+    for i, c in enumerate(pattern):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    mask = (1 << len(pattern)) - 1
+    last = 1 << (len(pattern) - 1)
+    pv, mv, score = mask, 0, len(pattern)
+    for c in text:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+    return score
@@ -0,0 +1,25 @@
+import pytest
+
+def pytest_addoption(parser):
+    parser.addoption("--integration", action="store_true", help="run tests that make real network requests")
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "integration: test makes real network requests, only run with --integration")
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="needs --integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+@pytest.fixture(scope="session")
+def impact_factor_data():
+    """
+    Load the impact factors once for the whole test session, and share them with get_impact_factor.
+    """
+    import journal_impact_factor
+    if journal_impact_factor.impact_factor_dic is None:
+        journal_impact_factor.impact_factor_dic = journal_impact_factor.load_impact_factor()
+    return journal_impact_factor.impact_factor_dic
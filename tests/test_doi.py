@@ -1,7 +1,18 @@
 import pytest
+import doi
 from doi import get_doi
 
-def test_get_doi():
+NATURE_HTML = '<html><head><meta name="citation_doi" content="10.1038/nclimate2195"/></head><body></body></html>'
+
+def test_get_doi(monkeypatch):
+    # Serve the page from memory so the test does not depend on the network
+    monkeypatch.setattr(doi, "get_url_content", lambda url: NATURE_HTML)
+    publication_url = "https://www.nature.com/articles/nclimate2195"
+    expected_doi = "10.1038/nclimate2195"
+    assert get_doi(publication_url, "Rummer") == expected_doi
+
+@pytest.mark.integration
+def test_get_doi_live():
     publication_url = "https://www.nature.com/articles/nclimate2195"
     expected_doi = "10.1038/nclimate2195"
     assert get_doi(publication_url, "Rummer") == expected_doi
@@ -1,13 +1,74 @@
+import os
+import json
+import time
 import pytest
-from journal_impact_factor import get_impact_factor
+import journal_impact_factor
+from journal_impact_factor import get_impact_factor, load_cached_impact_factor, save_cached_impact_factor, add_impact_factor
 
-def test_get_impact_factor():
-    journal_name = "Nature"
-    expected_impact_factor = "64.8"
+# The lookups need either the Google Sheets credentials or an unexpired copy of the sheet cached by an earlier run
+requires_impact_factor_data = pytest.mark.skipif(
+    not os.path.exists("google-credentials.json") and load_cached_impact_factor() is None,
+    reason="Google Sheets credentials or cached impact factors not available",
+)
+
+@requires_impact_factor_data
+def test_load_impact_factor(impact_factor_data):
+    assert impact_factor_data
+    assert all(journal_name == journal_name.lower() for journal_name in impact_factor_data)
+
+@requires_impact_factor_data
+@pytest.mark.parametrize("journal_name, expected_impact_factor", [
+    ("Nature", "64.8"),
+    (" nature ", "64.8"),
+])
+def test_get_impact_factor(impact_factor_data, journal_name, expected_impact_factor):
     assert get_impact_factor(journal_name) == expected_impact_factor
 
 
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    # Point the cache at a temporary file, so these tests need no credentials and leave no files behind
+    path = tmp_path / "impact_factor_cache.json"
+    monkeypatch.setattr(journal_impact_factor, "IMPACT_FACTOR_CACHE_FILE", str(path))
+    return path
+
+def test_cached_impact_factor_round_trip(cache_file):
+    save_cached_impact_factor({"nature": "64.8"})
+    assert load_cached_impact_factor() == {"nature": "64.8"}
+    assert not list(cache_file.parent.glob("*.tmp.*"))
+
+def test_cached_impact_factor_missing(cache_file):
+    assert load_cached_impact_factor() is None
+
+def test_cached_impact_factor_expired(cache_file):
+    fetched_at = time.time() - journal_impact_factor.IMPACT_FACTOR_CACHE_TTL - 60
+    cache_file.write_text(json.dumps({"fetched_at": fetched_at, "data": {"nature": "64.8"}}))
+    assert load_cached_impact_factor() is None
+
+@pytest.mark.parametrize("contents", [b'{"fetched_at": 1', b"\xff\xfe", b"[]"])
+def test_cached_impact_factor_unreadable(cache_file, contents):
+    cache_file.write_bytes(contents)
+    assert load_cached_impact_factor() is None
+
+def test_add_impact_factor_invalidates_cache(cache_file, monkeypatch):
+    class FakeSheet:
+        def __init__(self):
+            self.rows = []
+        def append_row(self, row):
+            self.rows.append(row)
+    sheet = FakeSheet()
+    monkeypatch.setattr(journal_impact_factor, "get_sheet", lambda: sheet)
+    monkeypatch.setattr(journal_impact_factor, "impact_factor_dic", {"nature": "64.8"})
+    save_cached_impact_factor({"nature": "64.8"})
+
+    add_impact_factor("Journal of Fish Biology", "")
+
+    assert sheet.rows == [["Journal of Fish Biology", ""]]
+    assert journal_impact_factor.impact_factor_dic["journal of fish biology"] == ""
+    # The next load must read the sheet, which now has the new row
+    assert load_cached_impact_factor() is None
+
 
 #print(get_impact_factor("Diversity"))
 #print(get_impact_factor("Nature"))
-#print(get_impact_factor("Global change biology"))
\ No newline at end of file
+#print(get_impact_factor("Global change biology"))
@@ -0,0 +1,70 @@
+import gzip
+import os
+import pytest
+import serve
+
+SCHOLAR_ID = "ynWS968AAAAJ"
+SCHOLAR_JSON = b'{"name": "Jodie L. Rummer", "publications": []}'
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    # serve.py reads scholar_data/ relative to the working directory
+    (tmp_path / "scholar_data").mkdir()
+    (tmp_path / "scholar_data" / f"{SCHOLAR_ID}.json").write_bytes(SCHOLAR_JSON)
+    monkeypatch.chdir(tmp_path)
+    serve.load_scholar_bytes.cache_clear()
+    return serve.app.test_client()
+
+def test_get_scholar(client):
+    response = client.get(f"/scholar/{SCHOLAR_ID}", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert response.data == SCHOLAR_JSON
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["ETag"].startswith('W/"')
+    assert response.headers["Last-Modified"]
+    assert response.headers["Cache-Control"] == f"public, max-age={serve.SCHOLAR_MAX_AGE}"
+    assert response.headers["Vary"] == "Accept-Encoding"
+
+def test_get_scholar_gzip(client):
+    response = client.get(f"/scholar/{SCHOLAR_ID}", headers={"Accept-Encoding": "gzip, br"})
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.data) == SCHOLAR_JSON
+
+def test_get_scholar_if_none_match(client):
+    etag = client.get(f"/scholar/{SCHOLAR_ID}").headers["ETag"]
+    response = client.get(f"/scholar/{SCHOLAR_ID}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+    assert response.headers["Cache-Control"] == f"public, max-age={serve.SCHOLAR_MAX_AGE}"
+
+def test_get_scholar_if_modified_since(client):
+    last_modified = client.get(f"/scholar/{SCHOLAR_ID}").headers["Last-Modified"]
+    response = client.get(f"/scholar/{SCHOLAR_ID}", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+    assert response.data == b""
+
+def test_get_scholar_changed_file(client, tmp_path):
+    etag = client.get(f"/scholar/{SCHOLAR_ID}").headers["ETag"]
+    path = tmp_path / "scholar_data" / f"{SCHOLAR_ID}.json"
+    updated = b'{"name": "Jodie L. Rummer", "publications": [{}]}'
+    path.write_bytes(updated)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    response = client.get(f"/scholar/{SCHOLAR_ID}", headers={"If-None-Match": etag, "Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert response.data == updated
+    assert response.headers["ETag"] != etag
+
+def test_get_scholar_missing_file(client, tmp_path):
+    (tmp_path / "scholar_data" / f"{SCHOLAR_ID}.json").unlink()
+    response = client.get(f"/scholar/{SCHOLAR_ID}")
+    assert response.status_code == 404
+    assert response.get_json() == {"error": "Author not found"}
+
+def test_get_unknown_scholar(client):
+    response = client.get("/scholar/AAAAAAAAAAAA")
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Author not found"}
@@ -0,0 +1,81 @@
+import random
+import pytest
+import standardise
+from standardise import levenshtein, _levenshtein_bit_parallel
+
+def reference_levenshtein(seq1, seq2):
+    # Full-matrix DP, the textbook definition
+    matrix = [[0] * (len(seq2) + 1) for _ in range(len(seq1) + 1)]
+    for x in range(len(seq1) + 1):
+        matrix[x][0] = x
+    for y in range(len(seq2) + 1):
+        matrix[0][y] = y
+    for x in range(1, len(seq1) + 1):
+        for y in range(1, len(seq2) + 1):
+            matrix[x][y] = min(
+                matrix[x - 1][y] + 1,
+                matrix[x][y - 1] + 1,
+                matrix[x - 1][y - 1] + (seq1[x - 1] != seq2[y - 1]),
+            )
+    return matrix[-1][-1]
+
+def random_string(rng, length):
+    return "".join(rng.choice("abcd") for _ in range(length))
+
+# Pairs covering empty inputs and both sides of the 64 item bit-parallel limit
+EDGE_CASES = [
+    ("", ""),
+    ("", "abc"),
+    ("abc", ""),
+    ("kitten", "sitting"),
+    ("a" * 64, "b" * 64),
+    ("ab" * 32, "ba" * 32),
+    ("a" * 65, "a" * 64 + "b"),
+    ("abcd" * 16 + "a", "dcba" * 16 + "b"),
+]
+
+@pytest.fixture
+def pure_python(monkeypatch):
+    # Exercise the pure Python paths even when rapidfuzz is installed
+    monkeypatch.setattr(standardise, "rapidfuzz_levenshtein", None)
+
+@pytest.mark.parametrize("seq1, seq2", EDGE_CASES)
+def test_levenshtein_edge_cases(pure_python, seq1, seq2):
+    assert levenshtein(seq1, seq2) == reference_levenshtein(seq1, seq2)
+
+def test_bit_parallel_matches_reference():
+    rng = random.Random(1)
+    for _ in range(500):
+        pattern = random_string(rng, rng.randint(0, 64))
+        text = random_string(rng, rng.randint(0, 80))
+        assert _levenshtein_bit_parallel(pattern, text) == reference_levenshtein(pattern, text)
+
+def test_row_dp_matches_reference(pure_python):
+    rng = random.Random(2)
+    for _ in range(100):
+        # Both longer than 64, so levenshtein takes the DP path
+        seq1 = random_string(rng, rng.randint(65, 100))
+        seq2 = random_string(rng, rng.randint(65, 100))
+        assert levenshtein(seq1, seq2) == reference_levenshtein(seq1, seq2)
+
+def test_levenshtein_length_prefilter(pure_python):
+    assert levenshtein("a", "abcdef", max_dist=2) == 3
+    assert levenshtein("a" * 100, "", max_dist=10) == 11
+
+# Lengths within max_dist, so the prefilter can't decide and the distance itself is capped
+MAX_DIST_CASES = [
+    ("kitten", "sitting", 2, 3),
+    ("kitten", "sitting", 3, 3),
+    ("abcdef", "fedcba", 1, 2),
+    ("a" * 70, "b" * 70, 5, 6),
+    ("a" * 70, "a" * 69 + "b", 5, 1),
+]
+
+@pytest.mark.parametrize("seq1, seq2, max_dist, expected", MAX_DIST_CASES)
+def test_levenshtein_max_dist_pure_python(pure_python, seq1, seq2, max_dist, expected):
+    assert levenshtein(seq1, seq2, max_dist=max_dist) == expected
+
+@pytest.mark.parametrize("seq1, seq2, max_dist, expected", MAX_DIST_CASES)
+def test_levenshtein_max_dist_rapidfuzz(seq1, seq2, max_dist, expected):
+    pytest.importorskip("rapidfuzz")
+    assert levenshtein(seq1, seq2, max_dist=max_dist) == expected